@@ -4,16 +4,63 @@ ASCII Art Generator Core Module
 Handles the main text-to-ASCII conversion functionality
 """
 
+import functools
+from collections import namedtuple
+
 try:
     import pyfiglet
     PYFIGLET_AVAILABLE = True
 except ImportError:
     PYFIGLET_AVAILABLE = False
 
+@functools.lru_cache(maxsize=32)
+def _load_figlet(font):
+    """Build a Figlet for the given font, parsing each font file only once"""
+    return pyfiglet.Figlet(font=font)
+
+_RenderMeta = namedtuple('_RenderMeta', ['art', 'width', 'height'])
+
+# Longer texts (e.g. whole files) bypass the memo so it cannot pin huge renders
+_RENDER_CACHE_MAX_LEN = 256
+
+def _measure_render(font, text):
+    """Render text with pyfiglet and measure it"""
+    art = _load_figlet(font).renderText(text)
+    lines = [line for line in art.split('\n') if line.strip()]
+    # Width is None when the output has no visible lines
+    width = max((len(line) for line in lines), default=None)
+    return _RenderMeta(art, width, len(lines))
+
+_cached_render = functools.lru_cache(maxsize=512)(_measure_render)
+
+def _render_meta(font, text):
+    """Render and measure text, memoized on (font, text) for short texts"""
+    if len(text) > _RENDER_CACHE_MAX_LEN:
+        return _measure_render(font, text)
+    return _cached_render(font, text)
+
 class ASCIIGenerator:
     def __init__(self):
         self.current_font = 'standard'
-        self.fallback_patterns = self._load_fallback_patterns()
+        
+        # PYFIGLET_AVAILABLE is fixed at import, so pick the fallback
+        # implementations once instead of branching on every call
+        if not PYFIGLET_AVAILABLE:
+            self.text_to_ascii = self._generate_fallback
+            self.set_font = self._set_font_fallback
+            self.get_text_width = self._get_text_width_fallback
+            self.get_text_height = self._get_text_height_fallback
+            self.text_to_ascii_with_font = self._text_to_ascii_with_font_fallback
+
+    @functools.cached_property
+    def fallback_patterns(self):
+        """Built-in glyph patterns, loaded on first use of the fallback renderer"""
+        return self._load_fallback_patterns()
+
+    @functools.cached_property
+    def _fallback_rows(self):
+        """Per-row lookup tables derived from fallback_patterns"""
+        return self._build_fallback_rows(self.fallback_patterns)
         
     def _load_fallback_patterns(self):
         """Load basic ASCII patterns for fallback when pyfiglet is not available"""
@@ -61,53 +108,72 @@ class ASCIIGenerator:
             '9': [' 999 ', '9   9', ' 9999', '    9', ' 999 ']
         }
 
+    def _build_fallback_rows(self, patterns):
+        """Transpose glyph patterns into one byte-indexed row table per row"""
+        # Unknown characters use the question mark pattern
+        unknown = patterns.get('?', ['?????'] * 5)
+        rows = [[(unknown[i] + ' ').encode('ascii')] * 256 for i in range(5)]
+        for char, pattern in patterns.items():
+            # Map lowercase letters too so ASCII input needs no upper() copy
+            codes = {ord(char), ord(char.lower())}
+            for i in range(5):
+                # Store each glyph row with its trailing separator space
+                glyph_row = (pattern[i] + ' ').encode('ascii')
+                for code in codes:
+                    rows[i][code] = glyph_row
+        return rows
+
     def text_to_ascii(self, text):
         """Convert text to ASCII art"""
-        if PYFIGLET_AVAILABLE:
-            try:
-                return self._generate_with_pyfiglet(text)
-            except:
-                return self._generate_fallback(text)
-        else:
+        try:
+            return self._generate_with_pyfiglet(text)
+        except:
             return self._generate_fallback(text)
 
+    def text_to_ascii_with_font(self, text, font_name):
+        """Convert text to ASCII art in a given font without changing the current font"""
+        # One-off renders (e.g. previewing every font) skip the caches so
+        # they do not evict the current font's Figlet and renders
+        return pyfiglet.Figlet(font=font_name).renderText(text)
+
+    def _text_to_ascii_with_font_fallback(self, text, font_name):
+        """Fallback mode - every font renders with the built-in patterns"""
+        return self._generate_fallback(text)
+
     def _generate_with_pyfiglet(self, text):
         """Generate ASCII art using pyfiglet library"""
-        fig = pyfiglet.Figlet(font=self.current_font)
-        return fig.renderText(text)
+        return _render_meta(self.current_font, text).art
 
     def _generate_fallback(self, text):
         """Generate ASCII art using built-in patterns"""
-        text = text.upper()
-        lines = ['', '', '', '', '']
+        # Lowercase ASCII is in the row tables; other text still needs
+        # upper() since it can change length (e.g. 'ß' -> 'SS')
+        if not text.isascii():
+            text = text.upper()
         
-        for char in text:
-            if char in self.fallback_patterns:
-                pattern = self.fallback_patterns[char]
-                for i in range(5):
-                    lines[i] += pattern[i] + ' '
-            else:
-                # Unknown character - use question mark pattern
-                pattern = self.fallback_patterns.get('?', ['?????'] * 5)
-                for i in range(5):
-                    lines[i] += pattern[i] + ' '
+        # Characters outside latin-1 become '?' and render as unknown
+        codes = text.encode('latin-1', 'replace')
         
-        return '\n'.join(lines)
+        # map() and bytes.join keep the per-character loop in C
+        return '\n'.join(
+            b''.join(map(row.__getitem__, codes)).decode('ascii')
+            for row in self._fallback_rows
+        )
 
     def set_font(self, font_name):
         """Set the current font for ASCII generation"""
-        if PYFIGLET_AVAILABLE:
-            try:
-                # Test if font is valid
-                pyfiglet.Figlet(font=font_name)
-                self.current_font = font_name
-                return True
-            except:
-                return False
-        else:
-            # Fallback mode - accept any font name but use built-in patterns
+        try:
+            # Test if font is valid and keep the parsed font for rendering
+            _load_figlet(font_name)
             self.current_font = font_name
             return True
+        except:
+            return False
+
+    def _set_font_fallback(self, font_name):
+        """Fallback mode - accept any font name but use built-in patterns"""
+        self.current_font = font_name
+        return True
 
     def get_current_font(self):
         """Get the currently selected font"""
@@ -115,28 +181,28 @@ class ASCIIGenerator:
 
     def get_text_width(self, text):
         """Calculate the width of ASCII art for given text"""
-        if PYFIGLET_AVAILABLE:
-            try:
-                fig = pyfiglet.Figlet(font=self.current_font)
-                ascii_art = fig.renderText(text)
-                lines = ascii_art.split('\n')
-                return max(len(line) for line in lines if line.strip())
-            except:
-                return len(text) * 6  # Fallback width calculation
-        else:
-            return len(text) * 6  # Each character is about 6 chars wide in fallback
+        try:
+            width = _render_meta(self.current_font, text).width
+            if width is None:
+                return len(text) * 6
+            return width
+        except:
+            return len(text) * 6  # Fallback width calculation
+
+    def _get_text_width_fallback(self, text):
+        """Width of fallback art - each character is about 6 chars wide"""
+        return len(text) * 6
 
     def get_text_height(self, text):
         """Calculate the height of ASCII art for given text"""
-        if PYFIGLET_AVAILABLE:
-            try:
-                fig = pyfiglet.Figlet(font=self.current_font)
-                ascii_art = fig.renderText(text)
-                return len([line for line in ascii_art.split('\n') if line.strip()])
-            except:
-                return 5  # Fallback height
-        else:
-            return 5  # Fallback patterns are 5 lines high
+        try:
+            return _render_meta(self.current_font, text).height
+        except:
+            return 5  # Fallback height
+
+    def _get_text_height_fallback(self, text):
+        """Height of fallback art - the patterns are 5 lines high"""
+        return 5
 
     def create_border(self, ascii_art, border_char='*'):
         """Add a border around ASCII art"""
@@ -145,31 +211,21 @@ class ASCIIGenerator:
             return ascii_art
         
         # Find the maximum width
-        max_width = max(len(line) for line in lines)
+        max_width = max(map(len, lines))
         
         # Create top border
         top_border = border_char * (max_width + 4)
         
         # Create bordered lines
-        bordered_lines = [top_border]
-        for line in lines:
-            padded_line = line.ljust(max_width)
-            bordered_lines.append(f"{border_char} {padded_line} {border_char}")
-        bordered_lines.append(top_border)
+        body = [f"{border_char} {line:<{max_width}} {border_char}" for line in lines]
         
-        return '\n'.join(bordered_lines)
+        return '\n'.join([top_border, *body, top_border])
 
     def center_text(self, ascii_art, width):
         """Center ASCII art within a given width"""
         lines = ascii_art.split('\n')
-        centered_lines = []
         
-        for line in lines:
-            if len(line) < width:
-                padding = (width - len(line)) // 2
-                centered_line = ' ' * padding + line
-                centered_lines.append(centered_line)
-            else:
-                centered_lines.append(line)
+        # rjust is a no-op for lines already at or beyond the target width
+        centered_lines = [line.rjust((width + len(line)) // 2) for line in lines]
         
         return '\n'.join(centered_lines)
\ No newline at end of file
@@ -10,30 +10,101 @@ try:
 except ImportError:
     PYFIGLET_AVAILABLE = False
 
+import functools
+import json
 import os
+from bisect import bisect_left
+import re
+
+# Share ASCIIGenerator's Figlet cache so each font is parsed only once
+from ascii_generator import _load_figlet
 
 class FontManager:
+    # Ordered (category, keywords) rules; the first matching rule wins
+    _CATEGORY_RULES = (
+        ('block', ('block', 'big')),
+        ('script', ('script', 'cursive')),
+        ('digital', ('digital', 'lcd')),
+        ('small', ('small', 'mini', 'tiny')),
+        ('decorative', ('shadow', 'outline', 'border', 'star')),
+    )
+    # One anchored alternative per rule; alternatives are tried in rule order,
+    # so match().lastgroup names the first matching category
+    _CATEGORY_RE = re.compile('|'.join(
+        f"(?P<{category}>.*?(?:{'|'.join(keywords)}))"
+        for category, keywords in _CATEGORY_RULES
+    ))
+
+    FONT_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'ttaa', 'fonts.json')
+
     def __init__(self):
-        self.available_fonts = self._discover_fonts()
+        self._is_pyfiglet = PYFIGLET_AVAILABLE
         self.fallback_fonts = ['standard', 'block', 'bubble', 'digital', 'lean']
+        self.available_fonts = self._discover_fonts()
+        self._sorted_fonts = sorted(self.available_fonts)
+        self._fonts_lower = [font.lower() for font in self._sorted_fonts]
+        self._fonts_set = frozenset(self.available_fonts)
+        self._popular_fonts = self._find_popular_fonts()
 
     def _discover_fonts(self):
         """Discover all available fonts on the system"""
-        if PYFIGLET_AVAILABLE:
+        if self._is_pyfiglet:
             try:
-                return pyfiglet.FigletFont.getFonts()
+                cache_key = self._font_cache_key()
+                fonts = self._load_font_cache(cache_key)
+                if fonts is None:
+                    fonts = pyfiglet.FigletFont.getFonts()
+                    self._save_font_cache(cache_key, fonts)
+                return fonts
             except:
                 return self.fallback_fonts
         else:
             return self.fallback_fonts
 
+    def _font_cache_key(self):
+        """Identify the installed fonts by pyfiglet version and font directory mtimes"""
+        font_dirs = [
+            os.path.join(os.path.dirname(pyfiglet.__file__), 'fonts'),
+            getattr(pyfiglet, 'SHARED_DIRECTORY', '')
+        ]
+        return [getattr(pyfiglet, '__version__', '')] + [
+            os.path.getmtime(d) if os.path.isdir(d) else None for d in font_dirs
+        ]
+
+    def _load_font_cache(self, cache_key):
+        """Load the cached font list, or None if it is missing or stale"""
+        try:
+            with open(self.FONT_CACHE_FILE, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            # ValueError covers both JSON and Unicode decode errors
+            return None
+        
+        if not isinstance(cache, dict) or cache.get('key') != cache_key:
+            return None
+        
+        fonts = cache.get('fonts')
+        if not isinstance(fonts, list) or not all(isinstance(font, str) for font in fonts):
+            return None
+        return fonts
+
+    def _save_font_cache(self, cache_key, fonts):
+        """Save the discovered font list for subsequent runs"""
+        try:
+            os.makedirs(os.path.dirname(self.FONT_CACHE_FILE), exist_ok=True)
+            with open(self.FONT_CACHE_FILE, 'w', encoding='utf-8') as f:
+                json.dump({'key': cache_key, 'fonts': fonts}, f)
+        except (IOError, TypeError):
+            pass
+
     def get_available_fonts(self):
         """Return list of available fonts"""
-        return sorted(self.available_fonts)
+        # Copy so callers cannot reorder the list search_fonts depends on
+        return list(self._sorted_fonts)
 
     def is_font_available(self, font_name):
         """Check if a specific font is available"""
-        return font_name in self.available_fonts
+        return font_name in self._fonts_set
 
     def get_font_info(self, font_name):
         """Get information about a specific font"""
@@ -43,12 +114,12 @@ class FontManager:
         info = {
             'name': font_name,
             'available': True,
-            'type': 'pyfiglet' if PYFIGLET_AVAILABLE else 'fallback'
+            'type': 'pyfiglet' if self._is_pyfiglet else 'fallback'
         }
         
-        if PYFIGLET_AVAILABLE:
+        if self._is_pyfiglet:
             try:
-                fig = pyfiglet.Figlet(font=font_name)
+                fig = _load_figlet(font_name)
                 sample = fig.renderText('Abc')
                 info['sample'] = sample
                 info['height'] = len(sample.split('\n'))
@@ -63,6 +134,10 @@ class FontManager:
 
     def get_popular_fonts(self):
         """Return a list of popular/recommended fonts"""
+        return list(self._popular_fonts)
+
+    def _find_popular_fonts(self):
+        """Intersect the recommended fonts with the available ones"""
         popular = [
             'standard', 'slant', 'block', 'bubble', 'digital',
             'lean', 'mini', 'script', 'shadow', 'small'
@@ -80,13 +155,28 @@ class FontManager:
     def search_fonts(self, keyword):
         """Search for fonts containing a specific keyword"""
         keyword = keyword.lower()
-        matching_fonts = []
-        
-        for font in self.available_fonts:
-            if keyword in font.lower():
-                matching_fonts.append(font)
         
-        return sorted(matching_fonts)
+        # Filtering the pre-sorted list keeps the result sorted
+        return [
+            font for font, font_lower in zip(self._sorted_fonts, self._fonts_lower)
+            if keyword in font_lower
+        ]
+
+    @functools.cached_property
+    def _prefix_index(self):
+        """(lowercase keys, fonts) in case-insensitive order, built on first prefix search"""
+        # Unlike _sorted_fonts, this order is by lowercase name, so keep the
+        # keys and fonts together rather than as separate attributes
+        fonts = sorted(self._sorted_fonts, key=str.lower)
+        return [font.lower() for font in fonts], fonts
+
+    def search_fonts_prefix(self, prefix):
+        """Search for fonts whose name starts with a prefix (case-insensitive)"""
+        prefix = prefix.lower()
+        keys, fonts = self._prefix_index
+        start = bisect_left(keys, prefix)
+        end = bisect_left(keys, prefix + '\uffff')
+        return fonts[start:end]
 
     def get_font_categories(self):
         """Categorize fonts by style/type"""
@@ -100,20 +190,12 @@ class FontManager:
             'other': []
         }
         
-        for font in self.available_fonts:
-            font_lower = font.lower()
+        for font, font_lower in zip(self._sorted_fonts, self._fonts_lower):
+            match = self._CATEGORY_RE.match(font_lower)
             
-            if 'block' in font_lower or 'big' in font_lower:
-                categories['block'].append(font)
-            elif 'script' in font_lower or 'cursive' in font_lower:
-                categories['script'].append(font)
-            elif 'digital' in font_lower or 'lcd' in font_lower:
-                categories['digital'].append(font)
-            elif 'small' in font_lower or 'mini' in font_lower or 'tiny' in font_lower:
-                categories['small'].append(font)
-            elif any(word in font_lower for word in ['shadow', 'outline', 'border', 'star']):
-                categories['decorative'].append(font)
-            elif font in ['standard', 'lean']:
+            if match:
+                categories[match.lastgroup].append(font)
+            elif font in ('standard', 'lean'):
                 categories['standard'].append(font)
             else:
                 categories['other'].append(font)
@@ -126,9 +208,9 @@ class FontManager:
         if not self.is_font_available(font_name):
             return False, "Font not found"
         
-        if PYFIGLET_AVAILABLE:
+        if self._is_pyfiglet:
             try:
-                fig = pyfiglet.Figlet(font=font_name)
+                fig = _load_figlet(font_name)
                 test_output = fig.renderText('Test')
                 if not test_output.strip():
                     return False, "Font produces empty output"
@@ -143,9 +225,9 @@ class FontManager:
         if not self.is_font_available(font_name):
             return None
         
-        if PYFIGLET_AVAILABLE:
+        if self._is_pyfiglet:
             try:
-                fig = pyfiglet.Figlet(font=font_name)
+                fig = _load_figlet(font_name)
                 return fig.renderText(sample_text)
             except:
                 return f"Error generating sample for {font_name}"
@@ -202,7 +284,7 @@ class FontManager:
         
         stats = {
             'total_fonts': total_fonts,
-            'pyfiglet_available': PYFIGLET_AVAILABLE,
+            'pyfiglet_available': self._is_pyfiglet,
             'categories': {cat: len(fonts) for cat, fonts in categories.items()},
             'popular_fonts_available': len(self.get_popular_fonts())
         }
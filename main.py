@@ -16,6 +16,14 @@ class TextToASCIIApp:
         self.font_manager = FontManager()
         self.file_handler = FileHandler()
         self.utils = Utils()
+        self._actions = {
+            '1': self.generate_art,
+            '2': self.list_fonts,
+            '3': self.save_to_file,
+            '4': self.load_from_file,
+            '5': self.change_font,
+            '6': self.preview_fonts
+        }
 
     def display_menu(self):
         """Display the main menu options"""
@@ -91,19 +99,14 @@ class TextToASCIIApp:
             text = "Sample"
         
         fonts = self.font_manager.get_available_fonts()
-        current_font = self.generator.get_current_font()
         
         for font in fonts:
-            self.generator.set_font(font)
             try:
-                preview = self.generator.text_to_ascii(text)
+                preview = self.generator.text_to_ascii_with_font(text, font)
                 print(f"\n--- {font} ---")
                 print(preview)
             except:
                 print(f"\n--- {font} --- (Error generating preview)")
-        
-        # Restore original font
-        self.generator.set_font(current_font)
 
     def save_to_file(self):
         """Save ASCII art to a file"""
@@ -144,18 +147,9 @@ class TextToASCIIApp:
             self.display_menu()
             choice = input("\nSelect an option (1-7): ").strip()
             
-            if choice == '1':
-                self.generate_art()
-            elif choice == '2':
-                self.list_fonts()
-            elif choice == '3':
-                self.save_to_file()
-            elif choice == '4':
-                self.load_from_file()
-            elif choice == '5':
-                self.change_font()
-            elif choice == '6':
-                self.preview_fonts()
+            action = self._actions.get(choice)
+            if action:
+                action()
             elif choice == '7':
                 print("\nThank you for using Text-to-ASCII Art Generator!")
                 sys.exit(0)
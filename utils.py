@@ -4,15 +4,237 @@ Utility Functions Module
 Contains helper functions and utilities for ASCII art generation
 """
 
+import codecs
+import functools
 import re
 import sys
 import os
 import platform
-from typing import List, Tuple, Optional
+import random
+import signal
+import time
+from typing import List, NamedTuple, Tuple, Optional
+
+try:
+    import charset_normalizer
+    CHARSET_NORMALIZER_AVAILABLE = True
+except ImportError:
+    CHARSET_NORMALIZER_AVAILABLE = False
+
+_WS_RE = re.compile(r'\s+')
+_DISALLOWED_RE = re.compile(r'[^\w\s\.\,\!\?\-\+\=\(\)\[\]\{\}]')
+_INVALID_FILENAME_RE = re.compile(r'[<>:"/\\|?*]')
+_UNDERSCORE_RE = re.compile(r'[_\s]+')
+
+
+# Longest BOMs first so UTF-32 LE is not mistaken for UTF-16 LE
+_BOM_ENCODINGS = (
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16')
+)
+_ENCODING_SAMPLE_SIZE = 64 * 1024
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+_DEFAULT_SUFFIX = "..."
+_DEFAULT_SUFFIX_LEN = len(_DEFAULT_SUFFIX)
+
+# Seconds a queried terminal size is reused before asking the OS again
+_TERMINAL_SIZE_TTL = 0.5
+# Last queried ((columns, lines), time.monotonic()) pair, shared by all Utils;
+# replaced as a whole so readers never see a half-updated entry
+_terminal_size_cache = None
+
+
+def _on_terminal_resize(signum, frame):
+    """SIGWINCH handler invalidating the cached terminal size"""
+    global _terminal_size_cache
+    _terminal_size_cache = None
+
+
+def _watch_terminal_resize():
+    """Install the SIGWINCH handler once, where the platform has the signal"""
+    if not hasattr(signal, 'SIGWINCH'):
+        return
+    
+    try:
+        # Leave any handler installed by someone else in place
+        if signal.getsignal(signal.SIGWINCH) == signal.SIG_DFL:
+            signal.signal(signal.SIGWINCH, _on_terminal_resize)
+    except ValueError:
+        pass  # Handlers can only be installed from the main thread
+
+_COLOR_MAP = {
+    'black': '\033[30m',
+    'red': '\033[31m',
+    'green': '\033[32m',
+    'yellow': '\033[33m',
+    'blue': '\033[34m',
+    'magenta': '\033[35m',
+    'cyan': '\033[36m',
+    'white': '\033[37m',
+    'bright_black': '\033[90m',
+    'bright_red': '\033[91m',
+    'bright_green': '\033[92m',
+    'bright_yellow': '\033[93m',
+    'bright_blue': '\033[94m',
+    'bright_magenta': '\033[95m',
+    'bright_cyan': '\033[96m',
+    'bright_white': '\033[97m',
+    'reset': '\033[0m'
+}
+_RESET_CODE = _COLOR_MAP['reset']
+
+
+@functools.lru_cache(maxsize=1024)
+def _colorize(text, color_code, reset_code):
+    """Wrap text in color codes, memoized for repeated redraws"""
+    return f"{color_code}{text}{reset_code}"
+
+_QUOTES = (
+    "Dream Big",
+    "Stay Strong",
+    "Never Give Up",
+    "Be Awesome",
+    "Think Positive",
+    "Create Magic",
+    "Believe",
+    "Inspire",
+    "Achieve",
+    "Success",
+    "Victory",
+    "Champion",
+    "Excellence",
+    "Brilliant",
+    "Amazing"
+)
+
+_APP_INFO = {
+    'name': 'Text-to-ASCII Art Generator',
+    'version': '1.0.0',
+    'author': 'me',
+    'description': 'A comprehensive tool for converting text to ASCII art',
+    'python_version': sys.version,
+    'platform': platform.system(),
+    'features': [
+        'Multiple font support',
+        'File save/load functionality',
+        'Batch processing',
+        'HTML export',
+        'Font management',
+        'Text preprocessing'
+    ]
+}
+
+
+class _CleanTextTable(dict):
+    """str.translate table deleting the characters matched by _DISALLOWED_RE
+
+    Code points are classified on first use and cached, so the table never
+    has to cover all of Unicode up front.
+    """
+
+    def __missing__(self, code):
+        value = None if _DISALLOWED_RE.match(chr(code)) else code
+        self[code] = value
+        return value
+
+
+_CLEAN_TEXT_TABLE = _CleanTextTable()
+# ASCII bytes removed by clean_text, for the bytes.translate fast path
+_ASCII_DISALLOWED = bytes(i for i in range(128) if _DISALLOWED_RE.match(chr(i)))
+
+# ASCII character classes used by count_characters' bytes.translate fast path
+_LETTER, _DIGIT, _SPACE, _SPECIAL = range(4)
+
+
+def _ascii_class(code):
+    """Class code of an ASCII character (non-ASCII bytes never reach the table)"""
+    char = chr(code)
+    if char.isalpha():
+        return _LETTER
+    if char.isdigit():
+        return _DIGIT
+    if char.isspace():
+        return _SPACE
+    return _SPECIAL
+
+
+# Maps each byte to its class code in a single bytes.translate pass
+_ASCII_CLASS_TABLE = bytes(_ascii_class(i) for i in range(128)) + bytes([_SPECIAL]) * 128
+
+
+class _CharClassTable(dict):
+    """str.translate table mapping each code point to a one-letter class
+
+    'L' letter, 'D' digit, 'S' space, 'P' special and 'O' for the remaining
+    numeric characters that are alphanumeric but neither letter nor digit.
+    Code points are classified on first use and cached.
+    """
+
+    def __missing__(self, code):
+        char = chr(code)
+        if char.isalpha():
+            value = 'L'
+        elif char.isdigit():
+            value = 'D'
+        elif char.isspace():
+            value = 'S'
+        elif not char.isalnum():
+            value = 'P'
+        else:
+            value = 'O'
+        self[code] = value
+        return value
+
+
+_CHAR_CLASS_TABLE = _CharClassTable()
+
+# Widest progress bar whose rendered variants are cached
+_MAX_CACHED_BAR_WIDTH = 200
+
+
+@functools.lru_cache(maxsize=16)
+def _progress_bars(width):
+    """Every possible bar string for a width, indexed by filled cell count"""
+    return tuple('█' * filled + '░' * (width - filled) for filled in range(width + 1))
+
+class CharCounts(NamedTuple):
+    """Character class counts returned by Utils.count_characters"""
+    total: int
+    letters: int
+    digits: int
+    spaces: int
+    special: int
+
+
+class AsciiSize(NamedTuple):
+    """Estimated ASCII art dimensions returned by Utils.estimate_ascii_size"""
+    width: int
+    height: int
+    characters: int
+    estimated_lines: int
+
+
+class BenchmarkResult(NamedTuple):
+    """Timing summary returned by Utils.benchmark_generation (times in seconds)"""
+    min_time: float
+    max_time: float
+    avg_time: float
+    total_time: float
+    avg_ns_per_iter: int
+    iterations: int
+
 
 class Utils:
+    __slots__ = ('system_info',)
+
     def __init__(self):
         self.system_info = self._get_system_info()
+        _watch_terminal_resize()
 
     def _get_system_info(self):
         """Get system information"""
@@ -28,11 +250,15 @@ class Utils:
             return ""
         
         # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text.strip())
+        text = _WS_RE.sub(' ', text.strip())
         
         # Remove special characters that might cause issues
         # Keep alphanumeric, spaces, and common punctuation
-        text = re.sub(r'[^\w\s\.\,\!\?\-\+\=\(\)\[\]\{\}]', '', text)
+        if text.isascii():
+            # bytes.translate filters against a 256-entry table with no dict lookups
+            text = text.encode('ascii').translate(None, _ASCII_DISALLOWED).decode('ascii')
+        else:
+            text = text.translate(_CLEAN_TEXT_TABLE)
         
         return text
 
@@ -42,10 +268,10 @@ class Utils:
             return "ascii_art"
         
         # Remove invalid filename characters
-        filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
+        filename = _INVALID_FILENAME_RE.sub('_', filename)
         
         # Remove excessive underscores and spaces
-        filename = re.sub(r'[_\s]+', '_', filename)
+        filename = _UNDERSCORE_RE.sub('_', filename)
         
         # Trim and ensure it's not empty
         filename = filename.strip('_')
@@ -60,11 +286,21 @@ class Utils:
 
     def get_terminal_size(self) -> Tuple[int, int]:
         """Get terminal width and height"""
+        global _terminal_size_cache
+        now = time.monotonic()
+        
+        # Read the shared cache once; the SIGWINCH handler may clear it
+        cached = _terminal_size_cache
+        if cached is not None and now - cached[1] < _TERMINAL_SIZE_TTL:
+            return cached[0]
+        
         try:
             size = os.get_terminal_size()
-            return size.columns, size.lines
+            result = (size.columns, size.lines)
         except:
-            return 80, 24  # Default fallback
+            result = (80, 24)  # Default fallback
+        _terminal_size_cache = (result, now)
+        return result
 
     def wrap_text(self, text: str, width: int) -> List[str]:
         """Wrap text to fit within specified width"""
@@ -72,25 +308,25 @@ class Utils:
             return []
         
         words = text.split()
+        if not words:
+            return []
+        
+        # Track where the current line starts and its length including
+        # separating spaces; words are only joined when a line is flushed
         lines = []
-        current_line = []
-        current_length = 0
-        
-        for word in words:
-            word_length = len(word)
-            
-            if current_length + word_length + len(current_line) <= width:
-                current_line.append(word)
-                current_length += word_length
-            else:
-                if current_line:
-                    lines.append(' '.join(current_line))
-                current_line = [word]
-                current_length = word_length
+        start = 0
+        line_length = len(words[0])
         
-        if current_line:
-            lines.append(' '.join(current_line))
+        for i in range(1, len(words)):
+            word_length = len(words[i])
+            if line_length + 1 + word_length <= width:
+                line_length += 1 + word_length
+            else:
+                lines.append(' '.join(words[start:i]))
+                start = i
+                line_length = word_length
         
+        lines.append(' '.join(words[start:]))
         return lines
 
     def format_file_size(self, size_bytes: int) -> str:
@@ -98,43 +334,54 @@ class Utils:
         if size_bytes == 0:
             return "0 B"
         
-        size_names = ["B", "KB", "MB", "GB"]
-        i = 0
-        size = float(size_bytes)
+        # Each unit spans 10 bits, so the bit length picks the unit directly
+        magnitude = int(size_bytes).bit_length() - 1 if size_bytes >= 1 else 0
+        i = min(magnitude // 10, len(_SIZE_UNITS) - 1)
         
-        while size >= 1024.0 and i < len(size_names) - 1:
-            size /= 1024.0
-            i += 1
-        
-        return f"{size:.1f} {size_names[i]}"
+        return f"{size_bytes / (1 << (10 * i)):.1f} {_SIZE_UNITS[i]}"
 
-    def count_characters(self, text: str) -> dict:
+    def count_characters(self, text: str) -> CharCounts:
         """Count different types of characters in text"""
         if not text:
-            return {'total': 0, 'letters': 0, 'digits': 0, 'spaces': 0, 'special': 0}
-        
-        counts = {
-            'total': len(text),
-            'letters': sum(1 for c in text if c.isalpha()),
-            'digits': sum(1 for c in text if c.isdigit()),
-            'spaces': sum(1 for c in text if c.isspace()),
-            'special': sum(1 for c in text if not c.isalnum() and not c.isspace())
-        }
-        
-        return counts
+            return CharCounts(total=0, letters=0, digits=0, spaces=0, special=0)
+        
+        if text.isascii():
+            # Classify every byte in one C-level translate, then count classes
+            data = text.encode('ascii')
+            classes = data.translate(_ASCII_CLASS_TABLE)
+            letters = classes.count(_LETTER)
+            digits = classes.count(_DIGIT)
+            spaces = classes.count(_SPACE)
+            return CharCounts(
+                total=len(data),
+                letters=letters,
+                digits=digits,
+                spaces=spaces,
+                special=len(data) - letters - digits - spaces
+            )
+        
+        # Map every character to its class letter in one C-level pass
+        classes = text.translate(_CHAR_CLASS_TABLE)
+        return CharCounts(
+            total=len(text),
+            letters=classes.count('L'),
+            digits=classes.count('D'),
+            spaces=classes.count('S'),
+            special=classes.count('P')
+        )
 
-    def estimate_ascii_size(self, text: str, font_height: int = 5, char_width: int = 6) -> dict:
+    def estimate_ascii_size(self, text: str, font_height: int = 5, char_width: int = 6) -> AsciiSize:
         """Estimate the size of ASCII art output"""
         char_count = len(text)
         estimated_width = char_count * char_width
         estimated_height = font_height
         
-        return {
-            'width': estimated_width,
-            'height': estimated_height,
-            'characters': char_count,
-            'estimated_lines': estimated_height
-        }
+        return AsciiSize(
+            width=estimated_width,
+            height=estimated_height,
+            characters=char_count,
+            estimated_lines=estimated_height
+        )
 
     def create_progress_bar(self, current: int, total: int, width: int = 50) -> str:
         """Create a simple progress bar"""
@@ -145,7 +392,10 @@ class Utils:
         filled = int(width * progress)
         empty = width - filled
         
-        bar = '█' * filled + '░' * empty
+        if 0 <= filled <= width <= _MAX_CACHED_BAR_WIDTH:
+            bar = _progress_bars(width)[filled]
+        else:
+            bar = '█' * filled + '░' * empty
         percentage = int(progress * 100)
         
         return f"[{bar}] {percentage}% ({current}/{total})"
@@ -159,6 +409,11 @@ class Utils:
         if len(text) >= width:
             return text
         
+        if len(fill_char) == 1:
+            # Unlike str.center, format's '^' puts an odd padding char on
+            # the right, matching the manual split below
+            return format(text, f"{fill_char}^{width}")
+        
         padding = width - len(text)
         left_padding = padding // 2
         right_padding = padding - left_padding
@@ -170,114 +425,102 @@ class Utils:
         if not text:
             return False, "Text cannot be empty"
         
-        if len(text) < min_length:
+        length = len(text)
+        if length < min_length:
             return False, f"Text must be at least {min_length} characters long"
         
-        if len(text) > max_length:
+        if length > max_length:
             return False, f"Text cannot exceed {max_length} characters"
         
-        # Check for only whitespace
-        if not text.strip():
+        # Check for only whitespace (without allocating a stripped copy)
+        if text.isspace():
             return False, "Text cannot contain only whitespace"
         
         return True, "Valid input"
 
-    def truncate_text(self, text: str, max_length: int, suffix: str = "...") -> str:
+    def truncate_text(self, text: str, max_length: int, suffix: str = _DEFAULT_SUFFIX) -> str:
         """Truncate text to specified length with suffix"""
         if len(text) <= max_length:
             return text
         
-        return text[:max_length - len(suffix)] + suffix
+        suffix_length = _DEFAULT_SUFFIX_LEN if suffix is _DEFAULT_SUFFIX else len(suffix)
+        return text[:max_length - suffix_length] + suffix
 
     def parse_color_code(self, color_input: str) -> Optional[str]:
         """Parse color input and return valid color code"""
-        color_map = {
-            'black': '\033[30m',
-            'red': '\033[31m',
-            'green': '\033[32m',
-            'yellow': '\033[33m',
-            'blue': '\033[34m',
-            'magenta': '\033[35m',
-            'cyan': '\033[36m',
-            'white': '\033[37m',
-            'bright_black': '\033[90m',
-            'bright_red': '\033[91m',
-            'bright_green': '\033[92m',
-            'bright_yellow': '\033[93m',
-            'bright_blue': '\033[94m',
-            'bright_magenta': '\033[95m',
-            'bright_cyan': '\033[96m',
-            'bright_white': '\033[97m',
-            'reset': '\033[0m'
-        }
-        
-        return color_map.get(color_input.lower())
+        return _COLOR_MAP.get(color_input.lower())
 
     def colorize_text(self, text: str, color: str) -> str:
         """Add color codes to text"""
-        color_code = self.parse_color_code(color)
+        color_code = _COLOR_MAP.get(color.lower())
         if color_code:
-            reset_code = self.parse_color_code('reset')
-            return f"{color_code}{text}{reset_code}"
+            return _colorize(text, color_code, _RESET_CODE)
         return text
 
     def get_random_quote(self) -> str:
         """Get a random motivational quote for ASCII art"""
-        quotes = [
-            "Dream Big",
-            "Stay Strong",
-            "Never Give Up",
-            "Be Awesome",
-            "Think Positive",
-            "Create Magic",
-            "Believe",
-            "Inspire",
-            "Achieve",
-            "Success",
-            "Victory",
-            "Champion",
-            "Excellence",
-            "Brilliant",
-            "Amazing"
-        ]
-        
-        import random
-        return random.choice(quotes)
+        return random.choice(_QUOTES)
 
     def benchmark_generation(self, generator_func, text: str, iterations: int = 5):
         """Benchmark ASCII generation performance"""
-        import time
+        if iterations <= 0:
+            return None
         
-        times = []
+        # Warm up caches and lazy loading outside the timed runs
+        try:
+            generator_func(text)
+        except Exception:
+            pass
+        
+        times = [0] * iterations
+        completed = 0
         
         for _ in range(iterations):
-            start_time = time.time()
+            start = time.perf_counter_ns()
             try:
                 generator_func(text)
-                end_time = time.time()
-                times.append(end_time - start_time)
             except Exception:
                 continue
+            times[completed] = time.perf_counter_ns() - start
+            completed += 1
         
-        if not times:
+        if not completed:
             return None
         
-        return {
-            'min_time': min(times),
-            'max_time': max(times),
-            'avg_time': sum(times) / len(times),
-            'total_time': sum(times),
-            'iterations': len(times)
-        }
+        times = times[:completed]
+        total_ns = sum(times)
+        
+        return BenchmarkResult(
+            min_time=min(times) / 1e9,
+            max_time=max(times) / 1e9,
+            avg_time=total_ns / completed / 1e9,
+            total_time=total_ns / 1e9,
+            avg_ns_per_iter=total_ns // completed,
+            iterations=completed
+        )
 
     def detect_encoding(self, file_path: str) -> str:
-        """Detect file encoding"""
+        """Detect file encoding from a BOM or a bounded sample of the file"""
+        with open(file_path, 'rb') as f:
+            sample = f.read(_ENCODING_SAMPLE_SIZE)
+        
+        for bom, encoding in _BOM_ENCODINGS:
+            if sample.startswith(bom):
+                return encoding
+        
+        if CHARSET_NORMALIZER_AVAILABLE:
+            best = charset_normalizer.from_bytes(sample).best()
+            if best is not None:
+                return best.encoding
+        
+        # A truncated sample may end mid-character, so only a complete
+        # file is decoded as final
+        is_complete = len(sample) < _ENCODING_SAMPLE_SIZE
         encodings = ['utf-8', 'utf-16', 'ascii', 'latin1', 'cp1252']
         
         for encoding in encodings:
             try:
-                with open(file_path, 'r', encoding=encoding) as f:
-                    f.read()
+                codecs.getincrementaldecoder(encoding)().decode(sample, final=is_complete)
                 return encoding
             except (UnicodeDecodeError, UnicodeError):
                 continue
@@ -286,38 +529,25 @@ class Utils:
 
     def safe_print(self, text: str, encoding: Optional[str] = None):
         """Safely print text handling encoding issues"""
-        if encoding is None:
-            encoding = self.system_info['encoding']
-        
+        # One write() skips print()'s sep/end handling; the stream's own
+        # encoder still handles BOMs, newline translation and buffering
         try:
-            print(text)
+            sys.stdout.write(text + '\n')
         except UnicodeEncodeError:
             # Fallback to ASCII with error replacement
             safe_text = text.encode('ascii', errors='replace').decode('ascii')
-            print(safe_text)
+            sys.stdout.write(safe_text + '\n')
 
     def create_backup_name(self, base_name: str) -> str:
         """Create a backup filename with timestamp"""
-        import datetime
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Format the fields directly; strftime goes through locale-aware formatting
+        lt = time.localtime()
+        timestamp = (f"{lt.tm_year:04d}{lt.tm_mon:02d}{lt.tm_mday:02d}_"
+                     f"{lt.tm_hour:02d}{lt.tm_min:02d}{lt.tm_sec:02d}")
         name, ext = os.path.splitext(base_name)
         return f"{name}_backup_{timestamp}{ext}"
 
     def get_app_info(self) -> dict:
         """Get application information"""
-        return {
-            'name': 'Text-to-ASCII Art Generator',
-            'version': '1.0.0',
-            'author': 'me',
-            'description': 'A comprehensive tool for converting text to ASCII art',
-            'python_version': sys.version,
-            'platform': platform.system(),
-            'features': [
-                'Multiple font support',
-                'File save/load functionality',
-                'Batch processing',
-                'HTML export',
-                'Font management',
-                'Text preprocessing'
-            ]
-        }
\ No newline at end of file
+        # Copy so callers can't mutate the shared module-level info
+        return dict(_APP_INFO, features=list(_APP_INFO['features']))
\ No newline at end of file